@@ -11,9 +11,15 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from scipy.optimize import milp, LinearConstraint, Bounds
+from scipy.sparse import csc_array
 import plotly.express as px
 import plotly.graph_objects as go
 
+# Compiled solver kernels are imported so they build once per process, not per rerun
+from kernels import NUMBA_AVAILABLE
+if NUMBA_AVAILABLE:
+    from kernels import enum_knapsack, knapsack_dp
+
 # Page configuration
 st.set_page_config(
     page_title="GigOptimizer | Freelancer Project Selector",
@@ -22,8 +28,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for premium look
-st.markdown("""
+# Custom CSS for premium look, with whitespace collapsed so each rerun sends fewer bytes
+CUSTOM_CSS = " ".join("""
 <style>
     .main-header {
         font-size: 3rem;
@@ -77,12 +83,218 @@ st.markdown("""
         color: white;
     }
 </style>
-""", unsafe_allow_html=True)
+""".split())
+
+
+# Largest DP table (items x hour buckets) we build before handing off to MILP
+DP_MAX_CELLS = 5_000_000
+
+# Up to this many projects every subset is checked; beyond that the 2^n scan
+# is slower than the DP or meet-in-the-middle
+ENUM_MAX_PROJECTS = 10
+# Subsets evaluated per NumPy batch, which keeps the bit matrix around 10 MB
+ENUM_CHUNK_SIZE = 1 << 16
+# Up to this many projects, meet-in-the-middle enumeration is used instead of MILP;
+# past ~28 its 2^(n/2) subset tables make it slower than the MILP call
+MITM_MAX_PROJECTS = 28
+
+
+def _is_integer_knapsack(hours, available_hours):
+    """Check whether the problem fits the integer-hours knapsack DP."""
+    if np.any(hours < 0) or not np.all(np.equal(np.mod(hours, 1), 0)):
+        return False
+    capacity = int(np.floor(available_hours))
+    return capacity >= 0 and len(hours) * (capacity + 1) <= DP_MAX_CELLS
+
+
+def _solve_knapsack_dp(earnings, hours, available_hours):
+    """
+    Solve the 0/1 knapsack exactly with dynamic programming over integer hours.
+    
+    dp[h] holds the best earnings using at most h hours; take[i, h] records
+    whether project i improved dp[h], which lets us backtrack the selection.
+    Uses the compiled kernel when Numba is installed.
+    
+    Returns: Indices of the selected projects
+    """
+    n_items = len(earnings)
+    capacity = int(np.floor(available_hours))
+    hrs = hours.astype(np.int64)
+    
+    if NUMBA_AVAILABLE:
+        _, chosen = knapsack_dp(earnings, hrs, capacity)
+        return np.flatnonzero(chosen)
+    
+    dp = np.zeros(capacity + 1)
+    take = np.zeros((n_items, capacity + 1), dtype=bool)
+    
+    for i in range(n_items):
+        hi = hrs[i]
+        if hi > capacity:
+            continue
+        # Right-hand side is evaluated before assignment, so each project is used once
+        candidate = dp[:capacity + 1 - hi] + earnings[i]
+        better = candidate > dp[hi:]
+        take[i, hi:] = better
+        dp[hi:] = np.where(better, candidate, dp[hi:])
+    
+    # Backtrack from the full budget to recover the chosen projects
+    selected = []
+    h = capacity
+    for i in range(n_items - 1, -1, -1):
+        if take[i, h]:
+            selected.append(i)
+            h -= hrs[i]
+    
+    return np.array(selected[::-1], dtype=np.int64)
+
+
+def _subset_sums(earnings, hours):
+    """
+    Total pay and hours of every subset of projects.
+    
+    Subset m contains project i when bit i of m is set. Each batch of masks is
+    expanded into a 0/1 matrix so the totals are two matrix-vector products.
+    
+    Returns: Arrays of pay and hours indexed by subset bitmask
+    """
+    n_items = len(earnings)
+    n_subsets = 1 << n_items
+    shifts = np.arange(n_items, dtype=np.uint32)
+    
+    subset_pay = np.empty(n_subsets)
+    subset_hours = np.empty(n_subsets)
+    for start in range(0, n_subsets, ENUM_CHUNK_SIZE):
+        stop = min(start + ENUM_CHUNK_SIZE, n_subsets)
+        masks = np.arange(start, stop, dtype=np.uint32)[:, None]
+        bits = ((masks >> shifts) & 1).astype(np.float64)
+        subset_pay[start:stop] = bits @ earnings
+        subset_hours[start:stop] = bits @ hours
+    
+    return subset_pay, subset_hours
+
+
+def _mask_to_indices(mask, n_items):
+    """Indices of the projects whose bits are set in a subset bitmask"""
+    return np.flatnonzero((int(mask) >> np.arange(n_items)) & 1)
+
+
+def _solve_enumeration(earnings, hours, available_hours):
+    """
+    Solve the 0/1 knapsack exactly by checking every subset of projects.
+    
+    With Numba the subsets are scored one at a time without allocating;
+    otherwise all subset totals are built with NumPy.
+    
+    Returns: Indices of the selected projects
+    """
+    if NUMBA_AVAILABLE:
+        _, best_mask = enum_knapsack(earnings, hours, float(available_hours))
+        return _mask_to_indices(best_mask, len(earnings))
+    
+    subset_pay, subset_hours = _subset_sums(earnings, hours)
+    feasible_pay = np.where(subset_hours <= available_hours, subset_pay, -np.inf)
+    return _mask_to_indices(np.argmax(feasible_pay), len(earnings))
+
+
+def _solve_meet_in_middle(earnings, hours, available_hours):
+    """
+    Solve the 0/1 knapsack exactly by meet-in-the-middle enumeration.
+    
+    Every subset of each half of the projects is enumerated. The second half
+    is sorted by hours and reduced to the best pay reachable within each hour
+    total, so the best partner for every first-half subset is one binary search.
+    Only fractional-hour pools get here, which the UI never creates; it is
+    reached by calling optimize_projects directly.
+    
+    Returns: Indices of the selected projects
+    """
+    n_items = len(earnings)
+    half = n_items // 2
+    pay_a, hours_a = _subset_sums(earnings[:half], hours[:half])
+    pay_b, hours_b = _subset_sums(earnings[half:], hours[half:])
+    
+    # Best second-half pay (and the subset achieving it) within each hour total
+    order = np.argsort(hours_b, kind='stable')
+    sorted_hours_b = hours_b[order]
+    sorted_pay_b = pay_b[order]
+    best_pay_b = np.maximum.accumulate(sorted_pay_b)
+    positions = np.arange(len(order))
+    best_pos_b = np.maximum.accumulate(np.where(sorted_pay_b == best_pay_b, positions, 0))
+    
+    # The empty second-half subset always fits, so every feasible A subset gets a partner
+    feasible_a = hours_a <= available_hours
+    partner = np.searchsorted(sorted_hours_b, available_hours - hours_a, side='right') - 1
+    partner = np.maximum(partner, 0)
+    total_pay = np.where(feasible_a, pay_a + best_pay_b[partner], -np.inf)
+    
+    mask_a = np.argmax(total_pay)
+    mask_b = order[best_pos_b[partner[mask_a]]]
+    return np.concatenate([
+        _mask_to_indices(mask_a, half),
+        half + _mask_to_indices(mask_b, n_items - half)
+    ])
+
+
+@st.cache_data(max_entries=32)
+def _solve_cached(projects_tuple, available_hours, min_skill_match):
+    """
+    Solve the selection problem for a hashable snapshot of the project pool.
+    
+    projects_tuple holds one (total_pay, hours_required, skill_match) row per
+    project, so repeated runs with the same inputs come straight from the cache.
+    
+    Returns: Positions of the selected projects in the pool, or an error message
+    """
+    pay_all, hours_all, skill_all = np.array(projects_tuple, dtype=float).reshape(-1, 3).T
+    
+    # Filter by minimum skill match
+    eligible_positions = np.flatnonzero(skill_all >= min_skill_match)
+    
+    if len(eligible_positions) == 0:
+        return None, "No projects meet the minimum skill match requirement"
+    
+    n_eligible = len(eligible_positions)
+    
+    # Objective: Maximize earnings
+    # We use hourly_rate * hours as the total pay for each project
+    earnings = pay_all[eligible_positions]
+    hours = hours_all[eligible_positions]
+    
+    # Solve the optimization problem
+    try:
+        if n_eligible <= ENUM_MAX_PROJECTS:
+            selected_indices = _solve_enumeration(earnings, hours, available_hours)
+        elif _is_integer_knapsack(hours, available_hours):
+            selected_indices = _solve_knapsack_dp(earnings, hours, available_hours)
+        elif n_eligible <= MITM_MAX_PROJECTS:
+            selected_indices = _solve_meet_in_middle(earnings, hours, available_hours)
+        else:
+            c = -earnings  # Negative because milp minimizes
+            
+            # Constraint: Total hours <= Available hours
+            # (milp works on CSC matrices, so build the row in that format directly)
+            A = csc_array(hours.reshape(1, -1))
+            constraints = LinearConstraint(A, lb=-np.inf, ub=available_hours)
+            
+            # Bounds: Binary decision variables (0 or 1)
+            bounds = Bounds(lb=0, ub=1)
+            integrality = np.ones(n_eligible)  # All variables are integers
+            
+            result = milp(c, constraints=constraints, bounds=bounds, integrality=integrality)
+            
+            if not result.success:
+                return None, f"Optimization failed: {result.message}"
+            selected_indices = np.where(result.x > 0.5)[0]
+        
+        return eligible_positions[selected_indices], None
+    except Exception as e:
+        return None, f"Error during optimization: {str(e)}"
 
 
 def optimize_projects(projects_df, available_hours, min_skill_match=0):
     """
-    Optimize project selection using Mixed Integer Linear Programming.
+    Optimize project selection as an exact 0/1 knapsack.
     
     Objective: Maximize total earnings
     Constraints:
@@ -90,6 +302,11 @@ def optimize_projects(projects_df, available_hours, min_skill_match=0):
         - Skill match >= minimum threshold
         - Binary decision for each project (take it or not)
     
+    This is a 0/1 knapsack, so tiny pools are solved by checking every subset,
+    whole-number hours by dynamic programming and mid-sized pools by
+    meet-in-the-middle enumeration; MILP handles the rest.
+    Results are cached on the pay, hours and skill columns plus the constraints.
+    
     Returns: Selected projects and optimization results
     """
     n_projects = len(projects_df)
@@ -97,58 +314,80 @@ def optimize_projects(projects_df, available_hours, min_skill_match=0):
     if n_projects == 0:
         return None, None, "No projects to optimize"
     
-    # Filter by minimum skill match
-    eligible_mask = projects_df['skill_match'] >= min_skill_match
-    eligible_df = projects_df[eligible_mask].reset_index(drop=True)
+    solver_columns = projects_df[['total_pay', 'hours_required', 'skill_match']].to_numpy(dtype=float)
+    projects_tuple = tuple(map(tuple, solver_columns.tolist()))
+    selected_positions, error = _solve_cached(projects_tuple, available_hours, min_skill_match)
     
-    if len(eligible_df) == 0:
-        return None, None, "No projects meet the minimum skill match requirement"
+    if error:
+        return None, None, error
     
-    n_eligible = len(eligible_df)
+    selected_projects = projects_df.iloc[selected_positions].copy()
     
-    # Objective: Maximize earnings (minimize negative earnings)
-    # We use hourly_rate * hours as the total pay for each project
-    earnings = eligible_df['total_pay'].values
-    c = -earnings  # Negative because milp minimizes
-    
-    # Constraint: Total hours <= Available hours
-    hours = eligible_df['hours_required'].values
-    A = hours.reshape(1, -1)
+    total_earnings = selected_projects['total_pay'].sum()
+    total_hours = selected_projects['hours_required'].sum()
     
-    constraints = LinearConstraint(A, lb=-np.inf, ub=available_hours)
+    optimization_results = {
+        'total_earnings': total_earnings,
+        'total_hours': total_hours,
+        'available_hours': available_hours,
+        'hours_remaining': available_hours - total_hours,
+        'projects_selected': len(selected_projects),
+        'projects_available': n_projects,
+        'utilization': (total_hours / available_hours) * 100 if available_hours > 0 else 0
+    }
     
-    # Bounds: Binary decision variables (0 or 1)
-    bounds = Bounds(lb=0, ub=1)
-    integrality = np.ones(n_eligible)  # All variables are integers
+    return selected_projects, optimization_results, None
+
+
+PROJECT_COLUMNS = [
+    'project_name', 'client', 'total_pay', 'hours_required', 'deadline_days', 'skill_match',
+    'hourly_rate'
+]
+
+# Numeric columns are typed once, when rows enter the pool
+PROJECT_DTYPES = {
+    'total_pay': 'float64',
+    'hours_required': 'float64',
+    'deadline_days': 'float64',
+    'skill_match': 'float64',
+    'hourly_rate': 'float64'
+}
+
+
+def _hourly_rate(total_pay, hours_required):
+    """Hourly rate of a project (or a column of projects)"""
+    return total_pay / hours_required
+
+
+def _with_hourly_rate(df):
+    """Return the project table with its hourly_rate column filled in"""
+    return df.assign(hourly_rate=_hourly_rate(df['total_pay'], df['hours_required']))
+
+
+def _set_project_rows(rows):
+    """Replace the project pool and drop the DataFrame built from the old one"""
+    st.session_state.projects_rows = rows
+    st.session_state.pop('projects_df_cache', None)
+
+
+def _projects_df():
+    """
+    Materialize the project pool as a DataFrame.
     
-    # Solve the optimization problem
-    try:
-        result = milp(c, constraints=constraints, bounds=bounds, integrality=integrality)
-        
-        if result.success:
-            selected_indices = np.where(result.x > 0.5)[0]
-            selected_projects = eligible_df.iloc[selected_indices].copy()
-            
-            total_earnings = selected_projects['total_pay'].sum()
-            total_hours = selected_projects['hours_required'].sum()
-            
-            optimization_results = {
-                'total_earnings': total_earnings,
-                'total_hours': total_hours,
-                'available_hours': available_hours,
-                'hours_remaining': available_hours - total_hours,
-                'projects_selected': len(selected_projects),
-                'projects_available': n_projects,
-                'utilization': (total_hours / available_hours) * 100 if available_hours > 0 else 0
-            }
-            
-            return selected_projects, optimization_results, None
-        else:
-            return None, None, f"Optimization failed: {result.message}"
-    except Exception as e:
-        return None, None, f"Error during optimization: {str(e)}"
+    Projects are stored as a list of row dicts in st.session_state.projects_rows
+    so adding one is a plain append. The frame is only rebuilt when the number
+    of rows has changed since it was last built.
+    """
+    rows = st.session_state.projects_rows
+    cached = st.session_state.get('projects_df_cache')
+    if cached is None or cached[0] != len(rows):
+        df = pd.DataFrame.from_records(rows, columns=PROJECT_COLUMNS).astype(PROJECT_DTYPES)
+        cached = (len(rows), df)
+        st.session_state.projects_df_cache = cached
+    return cached[1]
 
 
+@st.cache_data
 def create_sample_projects():
     """Generate sample project data for demonstration"""
     return pd.DataFrame({
@@ -171,7 +410,82 @@ def create_sample_projects():
     })
 
 
+@st.cache_data(max_entries=8)
+def _scatter_pay_hours(df):
+    """Build the pay vs hours scatter for the project pool"""
+    fig = px.scatter(
+        df,
+        x='hours_required',
+        y='total_pay',
+        size='skill_match',
+        color='hourly_rate',
+        hover_name='project_name',
+        labels={
+            'hours_required': 'Hours Required',
+            'total_pay': 'Total Pay ($)',
+            'skill_match': 'Skill Match',
+            'hourly_rate': 'Hourly Rate ($/hr)'
+        },
+        title='💰 Pay vs Time Investment',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def _bar_hourly_rate(df):
+    """Build the hourly rate comparison bar chart for the project pool"""
+    hourly_rate = df['hourly_rate'].to_numpy()
+    names = df['project_name'].to_numpy()
+    order = np.argsort(hourly_rate, kind='stable')
+    
+    # Plain arrays into go.Bar skip Plotly Express's DataFrame-to-trace conversion
+    fig = go.Figure(go.Bar(
+        x=hourly_rate[order].tolist(),
+        y=names[order].tolist(),
+        orientation='h',
+        marker=dict(
+            color=hourly_rate[order].tolist(),
+            colorscale='RdYlGn',
+            colorbar=dict(title='Hourly Rate ($/hr)')
+        ),
+        hovertemplate='Project=%{y}<br>Hourly Rate ($/hr)=%{x}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='💵 Hourly Rate Comparison',
+        xaxis_title='Hourly Rate ($/hr)',
+        yaxis_title='Project',
+        height=400,
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_data(max_entries=8)
+def _bar_earnings_comparison(total_all, hours_all, total_earnings, total_hours):
+    """Build the all-projects vs optimal earnings bar chart"""
+    comparison_df = pd.DataFrame({
+        'Scenario': ['If you took ALL', 'Optimal (within time)'],
+        'Earnings': [total_all, total_earnings],
+        'Hours': [hours_all, total_hours]
+    })
+    fig = px.bar(
+        comparison_df,
+        x='Scenario',
+        y='Earnings',
+        text='Earnings',
+        title='💰 Earnings Comparison',
+        color='Scenario',
+        color_discrete_sequence=['#94a3b8', '#6366f1']
+    )
+    fig.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
+    fig.update_layout(showlegend=False)
+    return fig
+
+
 def main():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    
     # Header
     st.markdown('<h1 class="main-header">🚀 GigOptimizer</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Maximize your freelance earnings with AI-powered project selection</p>', unsafe_allow_html=True)
@@ -199,20 +513,9 @@ def main():
             help="Only consider projects where your skills match at least this percentage"
         )
         
-        # Clear old results if constraints changed
-        if 'last_available_hours' not in st.session_state:
-            st.session_state.last_available_hours = available_hours
-            st.session_state.last_min_skill = min_skill_match
-        
-        if (st.session_state.last_available_hours != available_hours or 
-            st.session_state.last_min_skill != min_skill_match):
-            # Clear old optimization results when constraints change
-            if 'optimization_results' in st.session_state:
-                del st.session_state.optimization_results
-            if 'selected_projects' in st.session_state:
-                del st.session_state.selected_projects
-            st.session_state.last_available_hours = available_hours
-            st.session_state.last_min_skill = min_skill_match
+        # Results are tagged with the constraints they were solved for and only
+        # shown while those still match, so nothing needs clearing on change
+        st.session_state.constraint_version = (available_hours, min_skill_match)
         
         st.markdown("---")
         st.markdown("### 📊 How It Works")
@@ -225,7 +528,8 @@ def main():
         st.markdown("---")
         st.markdown("### 🧮 The Math Behind It")
         st.markdown("""
-        GigOptimizer uses **Mixed Integer Linear Programming (MILP)** to solve:
+        GigOptimizer solves this **0/1 knapsack** exactly, using dynamic
+        programming or subset enumeration (MILP for very large pools):
         
         **Maximize:** Total Earnings  
         **Subject to:** 
@@ -246,16 +550,14 @@ def main():
         with col1:
             use_sample = st.button("📋 Load Sample Data", help="Load example projects to see how it works")
         
-        if use_sample or 'projects_df' not in st.session_state:
-            if use_sample:
-                st.session_state.projects_df = create_sample_projects()
-                st.success("✅ Sample projects loaded! Go to 'Optimization Results' tab.")
+        if use_sample:
+            sample_df = _with_hourly_rate(create_sample_projects()).astype(PROJECT_DTYPES)
+            _set_project_rows(sample_df.to_dict('records'))
+            st.success("✅ Sample projects loaded! Go to 'Optimization Results' tab.")
         
-        # Initialize empty dataframe if needed
-        if 'projects_df' not in st.session_state:
-            st.session_state.projects_df = pd.DataFrame(columns=[
-                'project_name', 'client', 'total_pay', 'hours_required', 'deadline_days', 'skill_match'
-            ])
+        # Initialize empty project pool if needed
+        if 'projects_rows' not in st.session_state:
+            _set_project_rows([])
         
         # Add new project form
         st.markdown("#### ➕ Add a New Project")
@@ -273,33 +575,26 @@ def main():
             submitted = st.form_submit_button("➕ Add Project", use_container_width=True)
             
             if submitted and project_name:
-                new_project = pd.DataFrame({
-                    'project_name': [project_name],
-                    'client': [client],
-                    'total_pay': [float(total_pay)],
-                    'hours_required': [float(hours_required)],
-                    'deadline_days': [float(deadline_days)],
-                    'skill_match': [float(skill_match)]
+                st.session_state.projects_rows.append({
+                    'project_name': project_name,
+                    'client': client,
+                    'total_pay': float(total_pay),
+                    'hours_required': float(hours_required),
+                    'deadline_days': float(deadline_days),
+                    'skill_match': float(skill_match),
+                    'hourly_rate': _hourly_rate(float(total_pay), float(hours_required))
                 })
-                st.session_state.projects_df = pd.concat([st.session_state.projects_df, new_project], ignore_index=True)
                 st.success(f"✅ Added: {project_name}")
                 st.rerun()
         
+        projects_df = _projects_df()
+        
         # Display current projects
         st.markdown("#### 📋 Your Project Pool")
-        if len(st.session_state.projects_df) > 0:
-            # Calculate hourly rate for display
-            display_df = st.session_state.projects_df.copy()
-            # Ensure numeric types
-            display_df['total_pay'] = pd.to_numeric(display_df['total_pay'], errors='coerce')
-            display_df['hours_required'] = pd.to_numeric(display_df['hours_required'], errors='coerce')
-            display_df['skill_match'] = pd.to_numeric(display_df['skill_match'], errors='coerce')
-            display_df['deadline_days'] = pd.to_numeric(display_df['deadline_days'], errors='coerce')
-            display_df['hourly_rate'] = (display_df['total_pay'] / display_df['hours_required']).round(2)
-            
+        if len(projects_df) > 0:
             # Styled dataframe
             st.dataframe(
-                display_df,
+                projects_df,
                 column_config={
                     'project_name': st.column_config.TextColumn('Project', width='medium'),
                     'client': st.column_config.TextColumn('Client', width='small'),
@@ -313,23 +608,22 @@ def main():
                 use_container_width=True
             )
             
-            # Summary metrics
+            # Summary metrics (both totals in one pass over the pool)
+            pool_pay, pool_hours = projects_df[['total_pay', 'hours_required']].to_numpy().sum(axis=0)
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric("Total Projects", len(display_df))
+                st.metric("Total Projects", len(projects_df))
             with col2:
-                st.metric("Total Potential Pay", f"${display_df['total_pay'].sum():,.0f}")
+                st.metric("Total Potential Pay", f"${pool_pay:,.0f}")
             with col3:
-                st.metric("Total Hours Needed", f"{display_df['hours_required'].sum()} hrs")
+                st.metric("Total Hours Needed", f"{pool_hours:g} hrs")
             with col4:
-                avg_rate = display_df['total_pay'].sum() / display_df['hours_required'].sum()
+                avg_rate = pool_pay / pool_hours
                 st.metric("Avg Hourly Rate", f"${avg_rate:.2f}/hr")
             
             # Clear button
             if st.button("🗑️ Clear All Projects"):
-                st.session_state.projects_df = pd.DataFrame(columns=[
-                    'project_name', 'client', 'total_pay', 'hours_required', 'deadline_days', 'skill_match'
-                ])
+                _set_project_rows([])
                 st.rerun()
         else:
             st.info("👆 Add projects above or load sample data to get started!")
@@ -337,14 +631,14 @@ def main():
     with tab2:
         st.markdown("### 🎯 Optimal Project Selection")
         
-        if len(st.session_state.projects_df) == 0:
+        if len(projects_df) == 0:
             st.warning("⚠️ Add some projects first! Go to the 'Enter Projects' tab.")
         else:
             # Run optimization
             if st.button("🚀 Optimize My Projects", use_container_width=True, type="primary"):
                 with st.spinner("Running optimization algorithm..."):
                     selected, results, error = optimize_projects(
-                        st.session_state.projects_df,
+                        projects_df,
                         available_hours,
                         min_skill_match
                     )
@@ -354,9 +648,10 @@ def main():
                     else:
                         st.session_state.optimization_results = results
                         st.session_state.selected_projects = selected
+                        st.session_state.results_version = st.session_state.constraint_version
             
             # Display results
-            if 'optimization_results' in st.session_state and st.session_state.optimization_results:
+            if st.session_state.get('results_version') == st.session_state.constraint_version:
                 results = st.session_state.optimization_results
                 selected = st.session_state.selected_projects
                 
@@ -386,94 +681,61 @@ def main():
                 # Recommended projects
                 st.markdown("#### ✅ TAKE These Projects:")
                 if len(selected) > 0:
-                    for idx, row in selected.iterrows():
-                        hourly_rate = row['total_pay'] / row['hours_required']
-                        st.markdown(f"""
-                        <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); 
-                                    padding: 1rem 1.5rem; border-radius: 0.75rem; margin-bottom: 0.75rem; color: white;">
-                            <div style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.5rem;">
-                                {row['project_name']} <span style="font-weight: 400; opacity: 0.9;">— {row['client']}</span>
-                            </div>
-                            <div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem;">
-                                <span>💰 <strong>${row['total_pay']:,.0f}</strong></span>
-                                <span>⏱️ <strong>{row['hours_required']}</strong> hrs</span>
-                                <span>📊 <strong>{row['skill_match']}%</strong> match</span>
-                                <span>💵 <strong>${hourly_rate:.2f}</strong>/hr</span>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    # One markdown call for all cards instead of one per project
+                    cards = [
+                        f'<div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); '
+                        f'padding: 1rem 1.5rem; border-radius: 0.75rem; margin-bottom: 0.75rem; color: white;">'
+                        f'<div style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.5rem;">'
+                        f'{row.project_name} <span style="font-weight: 400; opacity: 0.9;">— {row.client}</span>'
+                        f'</div>'
+                        f'<div style="display: flex; gap: 1.5rem; flex-wrap: wrap; font-size: 0.95rem;">'
+                        f'<span>💰 <strong>${row.total_pay:,.0f}</strong></span>'
+                        f'<span>⏱️ <strong>{row.hours_required:g}</strong> hrs</span>'
+                        f'<span>📊 <strong>{row.skill_match:g}%</strong> match</span>'
+                        f'<span>💵 <strong>${row.hourly_rate:.2f}</strong>/hr</span>'
+                        f'</div>'
+                        f'</div>'
+                        for row in selected.itertuples(index=False)
+                    ]
+                    st.markdown("\n".join(cards), unsafe_allow_html=True)
                 
                 # Projects to skip
-                skipped = st.session_state.projects_df[
-                    ~st.session_state.projects_df['project_name'].isin(selected['project_name'])
-                ]
+                skip_mask = ~projects_df.index.isin(selected.index)
+                skipped = projects_df[skip_mask]
                 
                 if len(skipped) > 0:
                     st.markdown("#### ⏭️ SKIP These Projects:")
                     st.caption("These don't fit your optimal selection given time constraints")
-                    for idx, row in skipped.iterrows():
-                        st.markdown(f"""
-                        <div style="background: #f1f5f9; padding: 0.75rem 1rem; border-radius: 0.5rem; 
-                                    margin-bottom: 0.5rem; color: #64748b; border-left: 4px solid #cbd5e1;">
-                            <span style="text-decoration: line-through;">{row['project_name']}</span> 
-                            — {row['client']} 
-                            <span style="opacity: 0.7;">(${row['total_pay']:,.0f}, {row['hours_required']} hrs)</span>
-                        </div>
-                        """, unsafe_allow_html=True)
+                    # One markdown call for the whole list instead of one per project
+                    skipped_html = "".join(
+                        f'<div style="background: #f1f5f9; padding: 0.75rem 1rem; border-radius: 0.5rem; '
+                        f'margin-bottom: 0.5rem; color: #64748b; border-left: 4px solid #cbd5e1;">'
+                        f'<span style="text-decoration: line-through;">{row.project_name}</span> '
+                        f'— {row.client} '
+                        f'<span style="opacity: 0.7;">(${row.total_pay:,.0f}, {row.hours_required:g} hrs)</span>'
+                        f'</div>'
+                        for row in skipped.itertuples(index=False)
+                    )
+                    st.markdown(skipped_html, unsafe_allow_html=True)
     
     with tab3:
         st.markdown("### 📈 Project Analytics")
         
-        if len(st.session_state.projects_df) == 0:
+        if len(projects_df) == 0:
             st.warning("⚠️ Add some projects first!")
         else:
-            df = st.session_state.projects_df.copy()
-            # Ensure numeric columns are properly typed for Plotly
-            df['total_pay'] = pd.to_numeric(df['total_pay'], errors='coerce')
-            df['hours_required'] = pd.to_numeric(df['hours_required'], errors='coerce')
-            df['skill_match'] = pd.to_numeric(df['skill_match'], errors='coerce')
-            df['hourly_rate'] = df['total_pay'] / df['hours_required']
-            
             col1, col2 = st.columns(2)
             
             with col1:
                 # Pay vs Hours scatter
-                fig = px.scatter(
-                    df,
-                    x='hours_required',
-                    y='total_pay',
-                    size='skill_match',
-                    color='hourly_rate',
-                    hover_name='project_name',
-                    labels={
-                        'hours_required': 'Hours Required',
-                        'total_pay': 'Total Pay ($)',
-                        'skill_match': 'Skill Match',
-                        'hourly_rate': 'Hourly Rate ($/hr)'
-                    },
-                    title='💰 Pay vs Time Investment',
-                    color_continuous_scale='Viridis'
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_scatter_pay_hours(projects_df), use_container_width=True)
             
             with col2:
                 # Hourly rate comparison
-                fig = px.bar(
-                    df.sort_values('hourly_rate', ascending=True),
-                    x='hourly_rate',
-                    y='project_name',
-                    orientation='h',
-                    title='💵 Hourly Rate Comparison',
-                    labels={'hourly_rate': 'Hourly Rate ($/hr)', 'project_name': 'Project'},
-                    color='hourly_rate',
-                    color_continuous_scale='RdYlGn'
-                )
-                fig.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_bar_hourly_rate(projects_df), use_container_width=True)
             
             # If optimization was run, show comparison
-            if 'optimization_results' in st.session_state and st.session_state.optimization_results:
+            if st.session_state.get('results_version') == st.session_state.constraint_version:
                 st.markdown("---")
                 st.markdown("#### 🔍 Selection Analysis")
                 
@@ -481,48 +743,35 @@ def main():
                 results = st.session_state.optimization_results
                 
                 # Comparison: What if you took ALL projects?
-                total_all = df['total_pay'].sum()
-                hours_all = df['hours_required'].sum()
+                total_all = projects_df['total_pay'].sum()
+                hours_all = projects_df['hours_required'].sum()
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    # Donut chart for hours
-                    fig = go.Figure(data=[go.Pie(
-                        labels=['Hours Used', 'Hours Remaining'],
-                        values=[results['total_hours'], results['hours_remaining']],
-                        hole=.6,
-                        marker_colors=['#6366f1', '#e2e8f0']
-                    )])
-                    fig.update_layout(
-                        title='⏱️ Time Utilization',
-                        annotations=[dict(text=f"{results['utilization']:.0f}%", x=0.5, y=0.5, font_size=24, showarrow=False)]
+                    # Time utilization gauge (two numbers don't need a Plotly chart)
+                    st.markdown("##### ⏱️ Time Utilization")
+                    st.progress(
+                        min(results['utilization'] / 100, 1.0),
+                        text=f"{results['utilization']:.0f}% used · "
+                             f"{results['hours_remaining']:.0f} of {results['available_hours']} hours remaining"
                     )
-                    st.plotly_chart(fig, use_container_width=True)
                 
                 with col2:
                     # Comparison chart
-                    comparison_df = pd.DataFrame({
-                        'Scenario': ['If you took ALL', 'Optimal (within time)'],
-                        'Earnings': [total_all, results['total_earnings']],
-                        'Hours': [hours_all, results['total_hours']]
-                    })
-                    fig = px.bar(
-                        comparison_df,
-                        x='Scenario',
-                        y='Earnings',
-                        text='Earnings',
-                        title='💰 Earnings Comparison',
-                        color='Scenario',
-                        color_discrete_sequence=['#94a3b8', '#6366f1']
+                    fig = _bar_earnings_comparison(
+                        total_all, hours_all, results['total_earnings'], results['total_hours']
+                    )
+                    # Static render: no hover or zoom wiring for a two-bar summary
+                    st.plotly_chart(
+                        fig,
+                        use_container_width=True,
+                        config={'staticPlot': True, 'displayModeBar': False}
                     )
-                    fig.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
-                    fig.update_layout(showlegend=False)
-                    st.plotly_chart(fig, use_container_width=True)
                 
                 # Key insight
                 if hours_all > available_hours:
                     st.info(f"""
-                    💡 **Key Insight:** Taking all {len(df)} projects would require {hours_all} hours, 
+                    💡 **Key Insight:** Taking all {len(projects_df)} projects would require {hours_all:g} hours, 
                     but you only have {available_hours} hours available. The optimizer selected the 
                     {results['projects_selected']} projects that maximize your earnings within your time constraint.
                     """)
@@ -532,7 +781,7 @@ def main():
     st.markdown("""
     <div style="text-align: center; color: #64748b; font-size: 0.9rem;">
         <p><strong>GigOptimizer</strong> | Built for ISOM 839 - Prescriptive Analytics | Suffolk University</p>
-        <p>Powered by Mixed Integer Linear Programming (MILP) with SciPy</p>
+        <p>Powered by exact knapsack optimization with NumPy and SciPy</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -0,0 +1,66 @@
+"""
+Numba-compiled kernels for GigOptimizer's exact solvers.
+
+Streamlit re-executes app.py on every rerun, so the kernels live in this
+imported module: they are compiled (or loaded from Numba's cache) and warmed
+up once per process instead of once per slider tick.
+"""
+
+import numpy as np
+
+# Numba is optional: the solvers fall back to NumPy when it isn't installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def knapsack_dp(pay, hrs, capacity):
+        """Compiled knapsack DP. Returns the best earnings and a take/skip mask."""
+        n_items = pay.shape[0]
+        dp = np.zeros(capacity + 1)
+        take = np.zeros((n_items, capacity + 1), dtype=np.bool_)
+        
+        for i in range(n_items):
+            hi = hrs[i]
+            for h in range(capacity, hi - 1, -1):
+                candidate = dp[h - hi] + pay[i]
+                if candidate > dp[h]:
+                    dp[h] = candidate
+                    take[i, h] = True
+        
+        chosen = np.zeros(n_items, dtype=np.bool_)
+        h = capacity
+        for i in range(n_items - 1, -1, -1):
+            if take[i, h]:
+                chosen[i] = True
+                h -= hrs[i]
+        
+        return dp[capacity], chosen
+    
+    @njit(cache=True)
+    def enum_knapsack(pay, hrs, capacity):
+        """Compiled subset enumeration. Returns the best earnings and its bitmask."""
+        n_items = pay.shape[0]
+        best_pay = -np.inf
+        best_mask = 0
+        
+        for m in range(1 << n_items):
+            total_pay = 0.0
+            total_hours = 0.0
+            for i in range(n_items):
+                if m & (1 << i):
+                    total_pay += pay[i]
+                    total_hours += hrs[i]
+            if total_hours <= capacity and total_pay > best_pay:
+                best_pay = total_pay
+                best_mask = m
+        
+        return best_pay, best_mask
+    
+    # Compile now so the first click on "Optimize" doesn't pay for it
+    knapsack_dp(np.zeros(1), np.ones(1, dtype=np.int64), 1)
+    enum_knapsack(np.zeros(1), np.ones(1), 1.0)